@@ -1,11 +1,13 @@
+import functools
+import json
 import logging
 import os
-import platform
 import shlex
 import subprocess
+import sys
 import typing
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from colorama import Fore
 
@@ -20,9 +22,6 @@ else:
     except ImportError:
         from PySide2 import QtCore, QtGui, QtWidgets
 
-if platform.system() == "Linux":
-    from xdg.DesktopEntry import DesktopEntry
-
 from ..isolation_provider.base import IsolationProvider
 from ..logic import DangerzoneCore
 from ..settings import Settings
@@ -30,6 +29,27 @@ from ..util import get_resource_path, replace_control_chars
 
 log = logging.getLogger(__name__)
 
+_IS_DARWIN = sys.platform == "darwin"
+_IS_LINUX = sys.platform.startswith("linux")
+_IS_WINDOWS = sys.platform == "win32"
+
+PDF_VIEWERS_CACHE_FILENAME: str = "pdf_viewers.json"
+# Bump this whenever the format of the PDF viewers cache changes
+PDF_VIEWERS_CACHE_VERSION: int = 1
+
+# Environment variables that affect the translated names of the PDF viewers
+_LOCALE_ENV_VARS = ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG")
+
+# Directories where we look for .desktop files of PDF viewers (Linux only)
+PDF_VIEWERS_SEARCH_PATHS: List[str] = [
+    "/usr/share/applications",
+    "/usr/local/share/applications",
+    "~/.local/share/applications",
+]
+
+# Field codes in the Exec key of .desktop files, that stand for the file(s) to open
+_URL_PLACEHOLDERS = frozenset(("%f", "%F", "%u", "%U"))
+
 
 class DangerzoneGui(DangerzoneCore):
     """
@@ -50,75 +70,154 @@ class DangerzoneGui(DangerzoneCore):
         # Preload font
         self.fixed_font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
 
-        # Preload list of PDF viewers on computer
-        self.pdf_viewers = self._find_pdf_viewers()
+        # Paths of the window icon and logo
+        self._icon_path = get_resource_path(
+            "dangerzone.ico" if _IS_WINDOWS else "icon.png"
+        )
+        self._icon_png_path = get_resource_path("icon.png")
+
+        # Window icon and logo, decoded once on first use and shared by every dialog
+        self._window_icon: Optional[QtGui.QIcon] = None
+        self._logo_pixmap: Optional[QtGui.QPixmap] = None
+
+        # Reusable dialog for simple "Ok" alerts, created on first use
+        self._simple_alert: Optional["Alert"] = None
 
         # Are we done waiting (for Docker Desktop to be installed, or for container to install)
         self.is_waiting_finished = False
 
+    @functools.cached_property
+    def pdf_viewers(self) -> Dict[str, str]:
+        """List of PDF viewers on computer, looked up the first time it's needed."""
+        return self._find_pdf_viewers()
+
     def get_window_icon(self) -> QtGui.QIcon:
-        if platform.system() == "Windows":
-            path = get_resource_path("dangerzone.ico")
-        else:
-            path = get_resource_path("icon.png")
-        return QtGui.QIcon(path)
+        if self._window_icon is None:
+            self._window_icon = QtGui.QIcon(self._icon_path)
+        return self._window_icon
+
+    def get_logo_pixmap(self) -> QtGui.QPixmap:
+        if self._logo_pixmap is None:
+            self._logo_pixmap = QtGui.QPixmap.fromImage(
+                QtGui.QImage(self._icon_png_path)
+            )
+        return self._logo_pixmap
+
+    def show_alert(self, message: str) -> int:
+        """Show a message to the user, with just an "Ok" button.
+
+        The underlying dialog is created once, and then reused for every message.
+        """
+        if self._simple_alert is None:
+            self._simple_alert = Alert(self, has_cancel=False)
+        self._simple_alert.set_message(message)
+        return self._simple_alert.launch()
 
     def open_pdf_viewer(self, filename: str) -> None:
-        if platform.system() == "Darwin":
+        if _IS_DARWIN:
             # Open in Preview
             args = ["open", "-a", "Preview.app", filename]
 
             # Run
-            args_str = replace_control_chars(" ".join(shlex.quote(s) for s in args))
+            args_str = replace_control_chars(shlex.join(args))
             log.info(Fore.YELLOW + "> " + Fore.CYAN + args_str)
             subprocess.run(args)
 
-        elif platform.system() == "Windows":
+        elif _IS_WINDOWS:
             os.startfile(Path(filename))  # type: ignore [attr-defined]
 
-        elif platform.system() == "Linux":
+        elif _IS_LINUX:
             # Get the PDF reader command
-            args = shlex.split(self.pdf_viewers[self.settings.get("open_app")])
+            open_app = self.settings.get("open_app")
+            command = self.pdf_viewers.get(open_app)
+            if command is None:
+                log.warning(f"Could not find PDF viewer '{open_app}'")
+                return
+            args = shlex.split(command)
             # %f, %F, %u, and %U are filenames or URLS -- so replace with the file to open
-            for i in range(len(args)):
-                if (
-                    args[i] == "%f"
-                    or args[i] == "%F"
-                    or args[i] == "%u"
-                    or args[i] == "%U"
-                ):
-                    args[i] = filename
+            args = [filename if arg in _URL_PLACEHOLDERS else arg for arg in args]
 
             # Open as a background process
-            args_str = replace_control_chars(" ".join(shlex.quote(s) for s in args))
+            args_str = replace_control_chars(shlex.join(args))
             log.info(Fore.YELLOW + "> " + Fore.CYAN + args_str)
             subprocess.Popen(args)
 
-    def _find_pdf_viewers(self) -> Dict[str, str]:
-        pdf_viewers: Dict[str, str] = {}
-        if platform.system() == "Linux":
-            # Find all .desktop files
-            for search_path in [
-                "/usr/share/applications",
-                "/usr/local/share/applications",
-                os.path.expanduser("~/.local/share/applications"),
-            ]:
+    def _list_desktop_files(self) -> List[List[Any]]:
+        """List the path and mtime of every .desktop file that may be a PDF viewer.
+
+        This only needs the stat info of each file, which is much cheaper than parsing
+        it, and is enough to tell if our cached PDF viewers are still valid.
+        """
+        desktop_files: List[List[Any]] = []
+        for search_path in PDF_VIEWERS_SEARCH_PATHS:
+            try:
+                with os.scandir(os.path.expanduser(search_path)) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if not entry.name.endswith(".desktop"):
+                    continue
                 try:
-                    for filename in os.listdir(search_path):
-                        full_filename = os.path.join(search_path, filename)
-                        if os.path.splitext(filename)[1] == ".desktop":
-                            # See which ones can open PDFs
-                            desktop_entry = DesktopEntry(full_filename)
-                            if (
-                                "application/pdf" in desktop_entry.getMimeTypes()
-                                and "dangerzone" not in desktop_entry.getName().lower()
-                            ):
-                                pdf_viewers[desktop_entry.getName()] = (
-                                    desktop_entry.getExec()
-                                )
-
-                except FileNotFoundError:
+                    desktop_files.append([entry.path, entry.stat().st_mtime_ns])
+                except OSError:
+                    # E.g., a dangling symlink
                     pass
+        return desktop_files
+
+    def _load_pdf_viewers_cache(self, key: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        cache_filename = os.path.join(self.appdata_path, PDF_VIEWERS_CACHE_FILENAME)
+        try:
+            with open(cache_filename, "r") as f:
+                cache = json.load(f)
+            if cache["key"] == key and isinstance(cache["pdf_viewers"], dict):
+                return cache["pdf_viewers"]
+        except FileNotFoundError:
+            pass
+        except Exception:
+            log.debug("Could not load the PDF viewers cache, ignoring it")
+        return None
+
+    def _save_pdf_viewers_cache(
+        self, key: Dict[str, Any], pdf_viewers: Dict[str, str]
+    ) -> None:
+        cache_filename = os.path.join(self.appdata_path, PDF_VIEWERS_CACHE_FILENAME)
+        try:
+            os.makedirs(self.appdata_path, exist_ok=True)
+            with open(cache_filename, "w") as f:
+                json.dump({"key": key, "pdf_viewers": pdf_viewers}, f, indent=4)
+        except OSError:
+            log.debug("Could not save the PDF viewers cache, ignoring it")
+
+    def _find_pdf_viewers(self) -> Dict[str, str]:
+        pdf_viewers: Dict[str, str] = {}
+        if _IS_LINUX:
+            # Skip parsing the .desktop files if none of them has been added, removed or
+            # changed, and the locale is still the same, since our last lookup
+            desktop_files = self._list_desktop_files()
+            cache_key = {
+                "version": PDF_VIEWERS_CACHE_VERSION,
+                # The names of the PDF viewers are translated to the current locale
+                "locale": [os.environ.get(var) for var in _LOCALE_ENV_VARS],
+                "desktop_files": desktop_files,
+            }
+            cached_pdf_viewers = self._load_pdf_viewers_cache(cache_key)
+            if cached_pdf_viewers is not None:
+                return cached_pdf_viewers
+
+            # Imported here, so that we don't pay its cost when the cache is valid
+            from xdg.DesktopEntry import DesktopEntry
+
+            # See which .desktop files can open PDFs
+            for path, _ in desktop_files:
+                desktop_entry = DesktopEntry(path)
+                if (
+                    "application/pdf" in desktop_entry.getMimeTypes()
+                    and "dangerzone" not in desktop_entry.getName().lower()
+                ):
+                    pdf_viewers[desktop_entry.getName()] = desktop_entry.getExec()
+
+            self._save_pdf_viewers_cache(cache_key, pdf_viewers)
 
         return pdf_viewers
 
@@ -214,22 +313,26 @@ class Alert(Dialog):
 
     def create_layout(self) -> QtWidgets.QBoxLayout:
         logo = QtWidgets.QLabel()
-        logo.setPixmap(
-            QtGui.QPixmap.fromImage(QtGui.QImage(get_resource_path("icon.png")))
-        )
+        logo.setPixmap(self.dangerzone.get_logo_pixmap())
 
-        label = QtWidgets.QLabel()
-        label.setText(self.message)
-        label.setWordWrap(True)
-        label.setOpenExternalLinks(True)
+        self.label = QtWidgets.QLabel()
+        self.label.setText(self.message)
+        self.label.setWordWrap(True)
+        self.label.setOpenExternalLinks(True)
 
         message_layout = QtWidgets.QHBoxLayout()
         message_layout.addWidget(logo)
         message_layout.addSpacing(10)
-        message_layout.addWidget(label, stretch=1)
+        message_layout.addWidget(self.label, stretch=1)
 
         return message_layout
 
+    def set_message(self, message: str) -> None:
+        """Update the text of an existing alert, so that it can be launched again."""
+        self.message = message
+        self.label.setText(message)
+        self.adjustSize()
+
 
 class UpdateDialog(Dialog):
     def __init__(  # type: ignore [no-untyped-def]
@@ -76,9 +76,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Header
         logo = QtWidgets.QLabel()
-        logo.setPixmap(
-            QtGui.QPixmap.fromImage(QtGui.QImage(get_resource_path("icon.png")))
-        )
+        logo.setPixmap(self.dangerzone.get_logo_pixmap())
         header_label = QtWidgets.QLabel("Dangerzone")
         header_label.setFont(self.dangerzone.fixed_font)
         header_label.setStyleSheet("QLabel { font-weight: bold; font-size: 50px; }")
@@ -484,21 +482,17 @@ class ContentWidget(QtWidgets.QWidget):
 
     def documents_selected(self, docs: List[Document]) -> None:
         if self.conversion_started:
-            Alert(
-                self.dangerzone,
-                message="Dangerzone does not support adding documents after the conversion has started.",
-                has_cancel=False,
-            ).launch()
+            self.dangerzone.show_alert(
+                "Dangerzone does not support adding documents after the conversion has started."
+            )
             return
 
         # Ensure all files in batch are in the same directory
         dirnames = {os.path.dirname(doc.input_filename) for doc in docs}
         if len(dirnames) > 1:
-            Alert(
-                self.dangerzone,
-                message="Dangerzone does not support adding documents from multiple locations.\n\n The newly added documents were ignored.",
-                has_cancel=False,
-            ).launch()
+            self.dangerzone.show_alert(
+                "Dangerzone does not support adding documents from multiple locations.\n\n The newly added documents were ignored."
+            )
             return
 
         # Clear previously selected documents
@@ -684,8 +678,13 @@ class SettingsWidget(QtWidgets.QWidget):
             )
             self.open_checkbox.clicked.connect(self.update_ui)
             self.open_combobox = QtWidgets.QComboBox()
-            for k in self.dangerzone.pdf_viewers:
-                self.open_combobox.addItem(k, self.dangerzone.pdf_viewers[k])
+            # Looking up the PDF viewers may hit the disk, so do it once the window has
+            # been shown. The timer is a child of this widget, so that it never fires
+            # after the widget has been destroyed.
+            self.load_pdf_viewers_timer = QtCore.QTimer(self)
+            self.load_pdf_viewers_timer.setSingleShot(True)
+            self.load_pdf_viewers_timer.timeout.connect(self.load_pdf_viewers)
+            self.load_pdf_viewers_timer.start(0)
 
         open_layout = QtWidgets.QHBoxLayout()
         open_layout.addWidget(self.open_checkbox)
@@ -762,12 +761,13 @@ class SettingsWidget(QtWidgets.QWidget):
         else:
             self.open_checkbox.setCheckState(QtCore.Qt.Unchecked)
 
-        if platform.system() == "Linux":
-            index = self.open_combobox.findText(
-                self.dangerzone.settings.get("open_app")
-            )
-            if index != -1:
-                self.open_combobox.setCurrentIndex(index)
+    def load_pdf_viewers(self) -> None:
+        for k in self.dangerzone.pdf_viewers:
+            self.open_combobox.addItem(k, self.dangerzone.pdf_viewers[k])
+
+        index = self.open_combobox.findText(self.dangerzone.settings.get("open_app"))
+        if index != -1:
+            self.open_combobox.setCurrentIndex(index)
 
     def check_safe_extension_is_valid(self) -> bool:
         if self.save_checkbox.checkState() == QtCore.Qt.Unchecked:
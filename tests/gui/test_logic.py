@@ -0,0 +1,165 @@
+import json
+import logging
+import os
+import platform
+from pathlib import Path
+
+import pytest
+from pytest import LogCaptureFixture, MonkeyPatch
+from pytest_mock import MockerFixture
+from pytestqt.qtbot import QtBot
+
+from dangerzone.gui import logic
+from dangerzone.gui.updater import UpdaterThread
+
+from . import qt_updater, updater
+
+
+def write_desktop_file(path: Path, name: str, exec_line: str) -> None:
+    path.write_text(
+        "[Desktop Entry]\n"
+        "Type=Application\n"
+        f"Name={name}\n"
+        f"Exec={exec_line}\n"
+        "MimeType=application/pdf;\n"
+    )
+
+
+@pytest.mark.skipif(platform.system() != "Linux", reason="Linux-only test")
+def test_pdf_viewers_cache(
+    updater: UpdaterThread,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    mocker: MockerFixture,
+) -> None:
+    """Ensure that PDF viewers are parsed only when their .desktop files change."""
+    import xdg.DesktopEntry
+
+    dangerzone = updater.dangerzone
+    apps_dir = tmp_path / "applications"
+    apps_dir.mkdir()
+    monkeypatch.setattr(logic, "PDF_VIEWERS_SEARCH_PATHS", [str(apps_dir)])
+    viewer = apps_dir / "viewer.desktop"
+    write_desktop_file(viewer, "Viewer", "viewer %f")
+
+    # Check that the first lookup populates the cache.
+    cache_filename = os.path.join(
+        dangerzone.appdata_path, logic.PDF_VIEWERS_CACHE_FILENAME
+    )
+    assert not os.path.exists(cache_filename)
+    assert dangerzone.pdf_viewers == {"Viewer": "viewer %f"}
+    with open(cache_filename) as f:
+        cache = json.load(f)
+    assert cache["key"]["version"] == logic.PDF_VIEWERS_CACHE_VERSION
+    assert cache["pdf_viewers"] == {"Viewer": "viewer %f"}
+
+    # Check that the .desktop files are not parsed again, if they have not changed.
+    desktop_entry_spy = mocker.patch.object(
+        xdg.DesktopEntry,
+        "DesktopEntry",
+        wraps=xdg.DesktopEntry.DesktopEntry,
+    )
+    assert dangerzone._find_pdf_viewers() == {"Viewer": "viewer %f"}
+    desktop_entry_spy.assert_not_called()
+
+    # Edit the .desktop file in place, and check that we pick up the change. Bump its
+    # mtime explicitly, in case the filesystem has a coarse timestamp granularity.
+    write_desktop_file(viewer, "Viewer", "viewer --new %f")
+    stat = viewer.stat()
+    os.utime(viewer, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert dangerzone._find_pdf_viewers() == {"Viewer": "viewer --new %f"}
+    desktop_entry_spy.assert_called_once()
+
+    # Add a new .desktop file, and check that we pick it up as well.
+    write_desktop_file(apps_dir / "other.desktop", "Other", "other %U")
+    assert dangerzone._find_pdf_viewers() == {
+        "Viewer": "viewer --new %f",
+        "Other": "other %U",
+    }
+
+    # Change the locale, and check that the .desktop files are parsed again, since the
+    # names of the PDF viewers may be translated.
+    desktop_entry_spy.reset_mock()
+    assert dangerzone._find_pdf_viewers() == {
+        "Viewer": "viewer --new %f",
+        "Other": "other %U",
+    }
+    desktop_entry_spy.assert_not_called()
+    monkeypatch.setenv("LANGUAGE", "eo")
+    dangerzone._find_pdf_viewers()
+    assert desktop_entry_spy.call_count == 2
+    with open(cache_filename) as f:
+        cache = json.load(f)
+    assert "eo" in cache["key"]["locale"]
+
+    # Check that a cache with a different format version is ignored.
+    with open(cache_filename) as f:
+        cache = json.load(f)
+    cache["key"]["version"] = logic.PDF_VIEWERS_CACHE_VERSION + 1
+    cache["pdf_viewers"] = {"Stale Viewer": "stale %f"}
+    with open(cache_filename, "w") as f:
+        json.dump(cache, f)
+    assert "Stale Viewer" not in dangerzone._find_pdf_viewers()
+
+    # Check that a cache with a valid key but malformed PDF viewers is ignored.
+    with open(cache_filename) as f:
+        cache = json.load(f)
+    cache["pdf_viewers"] = ["Malformed Viewer"]
+    with open(cache_filename, "w") as f:
+        json.dump(cache, f)
+    assert dangerzone._find_pdf_viewers() == {
+        "Viewer": "viewer --new %f",
+        "Other": "other %U",
+    }
+
+
+def test_show_alert_reuses_dialog(
+    qtbot: QtBot, qt_updater: UpdaterThread, mocker: MockerFixture
+) -> None:
+    """Ensure that simple alerts share the same dialog, and update its message."""
+    dangerzone = qt_updater.dangerzone
+    launch_mock = mocker.patch.object(logic.Alert, "launch", return_value=1)
+
+    assert dangerzone.show_alert("First message") == 1
+    alert = dangerzone._simple_alert
+    assert alert is not None
+    qtbot.addWidget(alert)
+    assert alert.label.text() == "First message"
+    assert alert.cancel_button is None
+
+    assert dangerzone.show_alert("Second message") == 1
+    assert dangerzone._simple_alert is alert
+    assert alert.label.text() == "Second message"
+    assert launch_mock.call_count == 2
+
+
+def test_open_pdf_viewer(
+    updater: UpdaterThread,
+    monkeypatch: MonkeyPatch,
+    mocker: MockerFixture,
+    caplog: LogCaptureFixture,
+) -> None:
+    """Ensure that the selected PDF viewer is launched with the right arguments."""
+    # Follow the Linux code path, regardless of the platform we run on.
+    monkeypatch.setattr(logic, "_IS_DARWIN", False)
+    monkeypatch.setattr(logic, "_IS_WINDOWS", False)
+    monkeypatch.setattr(logic, "_IS_LINUX", True)
+    popen_mock = mocker.patch("dangerzone.gui.logic.subprocess.Popen")
+
+    dangerzone = updater.dangerzone
+    dangerzone.pdf_viewers = {"Viewer": "viewer --page 1 %f %U"}
+
+    # Check that the file placeholders are replaced with the filename.
+    dangerzone.settings.set("open_app", "Viewer")
+    dangerzone.open_pdf_viewer("/tmp/safe.pdf")
+    popen_mock.assert_called_once_with(
+        ["viewer", "--page", "1", "/tmp/safe.pdf", "/tmp/safe.pdf"]
+    )
+
+    # Check that a PDF viewer that no longer exists is not launched.
+    popen_mock.reset_mock()
+    caplog.set_level(logging.WARNING)
+    dangerzone.settings.set("open_app", "Missing Viewer")
+    dangerzone.open_pdf_viewer("/tmp/safe.pdf")
+    popen_mock.assert_not_called()
+    assert "Could not find PDF viewer 'Missing Viewer'" in caplog.text
@@ -1,10 +1,12 @@
 import os
 import pathlib
+import platform
 import shutil
 import time
 import typing
 
 from PySide6 import QtCore, QtWidgets
+import pytest
 from pytest import MonkeyPatch, fixture
 from pytest_mock import MockerFixture
 from pytestqt.qtbot import QtBot
@@ -13,7 +15,7 @@ from dangerzone.gui import MainWindow
 from dangerzone.gui import main_window as main_window_module
 from dangerzone.gui import updater as updater_module
 from dangerzone.gui.logic import DangerzoneGui
-from dangerzone.gui.main_window import ContentWidget
+from dangerzone.gui.main_window import ContentWidget, SettingsWidget
 from dangerzone.gui.updater import UpdateReport, UpdaterThread
 from dangerzone.util import get_version
 
@@ -377,3 +379,19 @@ def test_change_document_button(
     ]
     assert len(docs) is 1
     assert docs[0] == str(tmp_sample_doc)
+
+
+@pytest.mark.skipif(platform.system() != "Linux", reason="Linux-only test")
+def test_pdf_viewers_combobox(qtbot: QtBot, mocker: MockerFixture) -> None:
+    """Ensure that the PDF viewers are loaded after the settings widget is shown."""
+    mock_app = mocker.MagicMock()
+    dummy = mocker.MagicMock()
+    dz = DangerzoneGui(mock_app, dummy)
+    dz.pdf_viewers = {"Viewer A": "viewer-a %f", "Viewer B": "viewer-b %U"}
+    dz.settings.set("open_app", "Viewer B")
+
+    w = SettingsWidget(dz)
+    qtbot.addWidget(w)
+    qtbot.waitUntil(lambda: w.open_combobox.count() == 2)
+    assert w.open_combobox.currentText() == "Viewer B"
+    assert w.open_combobox.currentData() == "viewer-b %U"